@@ -221,6 +221,8 @@ async def get_agent_analysis(role: str, decision_text: str, mode: str = "enterpr
             return await call_mistral(cfg["model"], prompt)
         raise ValueError(f"Unknown provider: {cfg['provider']}")
 
+    provider_status = "primary"
+    fallback_provider = None
     try:
         # Try Primary
         data = await try_execute(config)
@@ -229,7 +231,9 @@ async def get_agent_analysis(role: str, decision_text: str, mode: str = "enterpr
         try:
             # Try Fallback
             fallback = FALLBACK_CONFIGS[role]
+            fallback_provider = fallback["provider"]
             data = await try_execute(fallback)
+            provider_status = "fallback"
         except Exception as fe:
             print(f"Fallback {role} failed: {fe}")
             return AgentResponse(
@@ -237,7 +241,10 @@ async def get_agent_analysis(role: str, decision_text: str, mode: str = "enterpr
                 verdict="Reject",
                 confidence=0,
                 reasoning=f"Critical Error: {str(e)}",
-                assumptions=["AI Provider services are currently unavailable"]
+                assumptions=["AI Provider services are currently unavailable"],
+                provider=config["provider"],
+                fallback_provider=fallback_provider,
+                provider_status="failed"
             )
 
     # Normalize assumptions (LLMs sometimes return objects instead of strings)
@@ -256,7 +263,10 @@ async def get_agent_analysis(role: str, decision_text: str, mode: str = "enterpr
         verdict=data.get("verdict", "Reject"),
         confidence=data.get("confidence", 0),
         reasoning=data.get("reasoning", "No reasoning provided."),
-        assumptions=normalized_assumptions
+        assumptions=normalized_assumptions,
+        provider=config["provider"],
+        fallback_provider=fallback_provider,
+        provider_status=provider_status
     )
 
 async def run_board_meeting(decision_text: str, mode: str = "enterprise"):
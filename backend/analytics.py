@@ -0,0 +1,188 @@
+from typing import Optional
+from datetime import datetime
+import json
+import os
+
+STATS_FILE = "decision_stats.json"
+DECISION_LOG_FILE = "decision_log.jsonl"  # Append-only log of every decision, used for rebuilds
+
+_stats: Optional[dict] = None
+
+def empty_stats() -> dict:
+    return {
+        "total_decisions": 0,
+        "confidence_sum": 0,
+        "verdicts_by_mode": {},
+        "role_agreement": {},
+        "providers": {},
+        "daily_counts": {}
+    }
+
+def _provider_counts(stats: dict, provider: str) -> dict:
+    return stats["providers"].setdefault(provider, {"calls": 0, "fallbacks": 0, "failures": 0})
+
+def _has_counters(group: dict, keys: tuple) -> bool:
+    return all(isinstance(counts, dict) and all(isinstance(counts.get(k), int) for k in keys) for counts in group.values())
+
+def _is_valid_stats(stats) -> bool:
+    """Checks a loaded stats file has every counter the summary reads."""
+    if not isinstance(stats, dict):
+        return False
+    if not all(isinstance(stats.get(key), type(default)) for key, default in empty_stats().items()):
+        return False
+    return (
+        _has_counters(stats["role_agreement"], ("agreed", "total"))
+        and _has_counters(stats["providers"], ("calls", "fallbacks", "failures"))
+        and all(isinstance(counts, dict) for counts in stats["verdicts_by_mode"].values())
+    )
+
+def apply_decision(stats: dict, entry: dict) -> dict:
+    """Folds a single decision into the running aggregates in place."""
+    final_verdict = entry.get("final_verdict", "Conditional")
+    mode = entry.get("mode", "enterprise")
+
+    stats["total_decisions"] += 1
+    stats["confidence_sum"] += entry.get("average_confidence", 0)
+
+    mode_counts = stats["verdicts_by_mode"].setdefault(mode, {})
+    mode_counts[final_verdict] = mode_counts.get(final_verdict, 0) + 1
+
+    for analysis in entry.get("agent_analyses", []):
+        status = analysis.get("provider_status")
+
+        # Failed calls carry a synthetic Reject vote, so they don't count towards agreement
+        if status != "failed":
+            role = stats["role_agreement"].setdefault(analysis.get("agent_role", "Unknown"), {"agreed": 0, "total": 0})
+            role["total"] += 1
+            if analysis.get("verdict") == final_verdict:
+                role["agreed"] += 1
+
+        # Entries saved before provider tracking was added carry no provider info
+        provider = analysis.get("provider")
+        if provider:
+            counts = _provider_counts(stats, provider)
+            counts["calls"] += 1
+            if status in ("fallback", "failed"):
+                counts["failures"] += 1
+
+        fallback_provider = analysis.get("fallback_provider")
+        if fallback_provider:
+            counts = _provider_counts(stats, fallback_provider)
+            counts["calls"] += 1
+            counts["fallbacks"] += 1
+            if status == "failed":
+                counts["failures"] += 1
+
+    # Bucket by calendar day of the ISO timestamp
+    day = (entry.get("timestamp") or "unknown")[:10]
+    stats["daily_counts"][day] = stats["daily_counts"].get(day, 0) + 1
+    return stats
+
+def load_stats() -> dict:
+    global _stats
+    if _stats is not None:
+        return _stats
+    if os.path.exists(STATS_FILE):
+        try:
+            with open(STATS_FILE, "r") as f:
+                stats = json.load(f)
+            if _is_valid_stats(stats):
+                _stats = stats
+                return _stats
+            print("Stats file has an unexpected schema, rebuilding")
+        except Exception as e:
+            print(f"Error loading stats, rebuilding: {e}")
+    return rebuild_stats()
+
+def save_stats(stats: dict):
+    try:
+        with open(STATS_FILE, "w") as f:
+            json.dump(stats, f, indent=2)
+    except Exception as e:
+        print(f"Error saving stats: {e}")
+
+def record_decision(entry: dict):
+    """Appends the decision to the log and updates the aggregates without rescanning history.
+
+    Expects the entry to already be in the history file, which seeds the log on first use.
+    """
+    if not os.path.exists(DECISION_LOG_FILE):
+        # Seeding from history already covers this entry, so don't apply it twice
+        rebuild_stats()
+        return
+
+    stats = load_stats()
+    try:
+        with open(DECISION_LOG_FILE, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+    except Exception as e:
+        print(f"Error appending to decision log: {e}")
+
+    save_stats(apply_decision(stats, entry))
+
+def read_decision_log() -> list:
+    entries = []
+    if not os.path.exists(DECISION_LOG_FILE):
+        return entries
+    with open(DECISION_LOG_FILE, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                print("Skipping malformed decision log line")
+    return entries
+
+def rebuild_stats() -> dict:
+    """Recomputes the aggregates from the decision log (or the history file if no log exists yet)."""
+    global _stats
+    if os.path.exists(DECISION_LOG_FILE):
+        entries = read_decision_log()
+    else:
+        # Import here to avoid a circular import with logic.py
+        from logic import load_history
+        entries = load_history()
+        # Seed the log so later rebuilds cover these entries too
+        try:
+            with open(DECISION_LOG_FILE, "w") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+        except Exception as e:
+            print(f"Error seeding decision log: {e}")
+
+    stats = empty_stats()
+    for entry in entries:
+        apply_decision(stats, entry)
+
+    _stats = stats
+    save_stats(stats)
+    return stats
+
+def _rate(part: int, total: int) -> float:
+    return round(part / total, 4) if total else 0.0
+
+def get_stats_summary() -> dict:
+    stats = load_stats()
+    total = stats["total_decisions"]
+    return {
+        "total_decisions": total,
+        "average_confidence": round(stats["confidence_sum"] / total, 2) if total else 0.0,
+        "verdicts_by_mode": stats["verdicts_by_mode"],
+        "role_agreement": {
+            role: {**counts, "agreement_rate": _rate(counts["agreed"], counts["total"])}
+            for role, counts in stats["role_agreement"].items()
+        },
+        "providers": {
+            provider: {
+                **counts,
+                "fallback_rate": _rate(counts["fallbacks"], counts["calls"]),
+                "failure_rate": _rate(counts["failures"], counts["calls"])
+            }
+            for provider, counts in stats["providers"].items()
+        },
+        "daily_counts": stats["daily_counts"],
+        # Timestamps are server-local (see logic.aggregate_verdicts), so "today" must be too
+        "today": datetime.now().date().isoformat()
+    }
@@ -3,6 +3,7 @@ from models import AgentResponse, ConsensusResponse
 from datetime import datetime
 import json
 import os
+from analytics import record_decision
 
 HISTORY_FILE = "decision_history.json"
 
@@ -46,8 +47,9 @@ def aggregate_verdicts(analyses: List[AgentResponse], decision_text: str, mode:
     return consensus
 
 def save_to_history(decision: ConsensusResponse):
+    entry = decision.dict()
     history = load_history()
-    history.append(decision.dict())
+    history.append(entry)
     
     try:
         with open(HISTORY_FILE, "w") as f:
@@ -55,6 +57,12 @@ def save_to_history(decision: ConsensusResponse):
     except Exception as e:
         print(f"Error saving history: {e}")
 
+    # Analytics must never block saving the decision itself
+    try:
+        record_decision(entry)
+    except Exception as e:
+        print(f"Error updating stats: {e}")
+
 def load_history() -> List[dict]:
     if not os.path.exists(HISTORY_FILE):
         return []
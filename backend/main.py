@@ -1,8 +1,9 @@
 from fastapi import FastAPI, HTTPException, Form, File, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from models import DecisionRequest, ConsensusResponse
+from models import DecisionRequest, ConsensusResponse, StatsResponse
 from agents import run_board_meeting
 from logic import aggregate_verdicts, load_history, get_cached_analysis
+from analytics import get_stats_summary, rebuild_stats
 from typing import List, Optional
 
 app = FastAPI(title="BoardGPT API")
@@ -61,6 +62,16 @@ async def analyze_decision(
 async def get_history():
     return load_history()
 
+@app.get("/stats", response_model=StatsResponse)
+async def get_stats():
+    return get_stats_summary()
+
+@app.post("/stats/rebuild", response_model=StatsResponse)
+async def rebuild_decision_stats():
+    # Recompute all aggregates from the decision log
+    rebuild_stats()
+    return get_stats_summary()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 class DecisionRequest(BaseModel):
     text: str = Field(..., min_length=10, description="The strategic business decision to analyze")
@@ -11,6 +11,9 @@ class AgentResponse(BaseModel):
     confidence: int = Field(..., ge=0, le=100)
     reasoning: str
     assumptions: List[str]
+    provider: Optional[str] = None  # Primary provider configured for this role
+    fallback_provider: Optional[str] = None  # Set only when the fallback was attempted
+    provider_status: Optional[str] = None  # primary, fallback, or failed
 
 class ConsensusResponse(BaseModel):
     decision_text: str
@@ -20,3 +23,24 @@ class ConsensusResponse(BaseModel):
     explanation: str
     mode: str = "enterprise"
     timestamp: Optional[str] = None
+
+class RoleAgreement(BaseModel):
+    agreed: int
+    total: int
+    agreement_rate: float
+
+class ProviderStats(BaseModel):
+    calls: int
+    fallbacks: int  # Calls this provider served as a fallback
+    failures: int
+    fallback_rate: float
+    failure_rate: float
+
+class StatsResponse(BaseModel):
+    total_decisions: int
+    average_confidence: float
+    verdicts_by_mode: Dict[str, Dict[str, int]]
+    role_agreement: Dict[str, RoleAgreement]
+    providers: Dict[str, ProviderStats]
+    daily_counts: Dict[str, int]
+    today: str  # Key into daily_counts for the server's current day
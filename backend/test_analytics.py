@@ -0,0 +1,99 @@
+import json
+import pytest
+import analytics
+
+def make_entry(final_verdict="Approve", mode="enterprise", timestamp="2026-10-19T10:00:00", analyses=None):
+    return {
+        "decision_text": "Should we expand into a new market this year",
+        "final_verdict": final_verdict,
+        "average_confidence": 80,
+        "agent_analyses": analyses if analyses is not None else [
+            {"agent_role": "Finance", "verdict": "Approve", "confidence": 80, "provider": "gemini", "provider_status": "primary"},
+            {"agent_role": "Risk", "verdict": "Reject", "confidence": 80, "provider": "groq", "provider_status": "primary"}
+        ],
+        "explanation": "",
+        "mode": mode,
+        "timestamp": timestamp
+    }
+
+@pytest.fixture(autouse=True)
+def isolated_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(analytics, "STATS_FILE", str(tmp_path / "decision_stats.json"))
+    monkeypatch.setattr(analytics, "DECISION_LOG_FILE", str(tmp_path / "decision_log.jsonl"))
+    monkeypatch.setattr(analytics, "_stats", None)
+    return tmp_path
+
+def write_log(entries):
+    with open(analytics.DECISION_LOG_FILE, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+def test_apply_decision_folds_aggregates():
+    stats = analytics.empty_stats()
+    analytics.apply_decision(stats, make_entry())
+    analytics.apply_decision(stats, make_entry(final_verdict="Reject", mode="startup", timestamp="2026-10-20T09:00:00"))
+
+    assert stats["total_decisions"] == 2
+    assert stats["confidence_sum"] == 160
+    assert stats["verdicts_by_mode"] == {"enterprise": {"Approve": 1}, "startup": {"Reject": 1}}
+    assert stats["role_agreement"]["Finance"] == {"agreed": 1, "total": 2}
+    assert stats["role_agreement"]["Risk"] == {"agreed": 1, "total": 2}
+    assert stats["daily_counts"] == {"2026-10-19": 1, "2026-10-20": 1}
+
+def test_apply_decision_charges_each_attempted_provider():
+    stats = analytics.empty_stats()
+    analytics.apply_decision(stats, make_entry(analyses=[
+        {"agent_role": "Finance", "verdict": "Approve", "provider": "gemini", "fallback_provider": "groq", "provider_status": "fallback"},
+        {"agent_role": "Strategy", "verdict": "Reject", "provider": "groq", "fallback_provider": "mistral", "provider_status": "failed"}
+    ]))
+
+    assert stats["providers"]["gemini"] == {"calls": 1, "fallbacks": 0, "failures": 1}
+    assert stats["providers"]["groq"] == {"calls": 2, "fallbacks": 1, "failures": 1}
+    assert stats["providers"]["mistral"] == {"calls": 1, "fallbacks": 1, "failures": 1}
+    # The synthetic Reject from a failed call is not a vote
+    assert "Strategy" not in stats["role_agreement"]
+
+def test_rebuild_matches_incremental():
+    entries = [make_entry(), make_entry(final_verdict="Conditional", mode="startup")]
+    write_log(entries[:1])
+
+    analytics.record_decision(entries[1])
+    incremental = analytics.get_stats_summary()
+
+    analytics._stats = None
+    analytics.rebuild_stats()
+    assert analytics.get_stats_summary() == incremental
+    assert incremental["total_decisions"] == 2
+
+def test_summary_keeps_counters_as_integers():
+    write_log([make_entry()])
+    summary = analytics.get_stats_summary()
+
+    assert summary["role_agreement"]["Finance"] == {"agreed": 1, "total": 1, "agreement_rate": 1.0}
+    assert summary["providers"]["groq"]["calls"] == 1
+    assert isinstance(summary["providers"]["groq"]["calls"], int)
+
+def test_invalid_stats_file_is_rebuilt():
+    write_log([make_entry()])
+    with open(analytics.STATS_FILE, "w") as f:
+        json.dump({"total_decisions": 5, "role_agreement": {"Finance": {}}}, f)
+
+    assert analytics.load_stats()["total_decisions"] == 1
+
+def test_first_record_seeds_log_without_double_count(isolated_files, monkeypatch):
+    pytest.importorskip("pydantic")
+    import logic
+
+    history_file = isolated_files / "decision_history.json"
+    monkeypatch.setattr(logic, "HISTORY_FILE", str(history_file))
+    history = [make_entry() for _ in range(3)]
+    new_entry = make_entry(final_verdict="Reject")
+    # save_to_history writes the history file before recording analytics
+    history_file.write_text(json.dumps(history + [new_entry]))
+
+    analytics.record_decision(new_entry)
+
+    assert analytics.load_stats()["total_decisions"] == 4
+    assert len(analytics.read_decision_log()) == 4
+    analytics._stats = None
+    assert analytics.rebuild_stats()["total_decisions"] == 4
@@ -38,6 +38,7 @@ function App() {
   const [analysis, setAnalysis] = useState(null);
   const [loading, setLoading] = useState(false);
   const [history, setHistory] = useState([]);
+  const [stats, setStats] = useState(null);
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [isSidebarOpen, setIsSidebarOpen] = useState(false);
@@ -86,8 +87,18 @@ function App() {
     }
   };
 
+  const fetchStats = async () => {
+    try {
+      const response = await axios.get(`${API_BASE_URL}/stats`);
+      setStats(response.data);
+    } catch (err) {
+      console.error("Failed to fetch stats:", err);
+    }
+  };
+
   useEffect(() => {
     fetchHistory();
+    fetchStats();
   }, []);
 
   const handleAnalyze = async (text, file = null) => {
@@ -132,6 +143,7 @@ function App() {
 
       setAnalysis(response.data);
       fetchHistory();
+      fetchStats();
     } catch (err) {
       setError(err.response?.data?.detail || "An error occurred during analysis.");
       console.error("Analysis failed:", err);
@@ -260,13 +272,19 @@ Assumptions: ${(a.assumptions || []).join(', ')}
     </div>
   );
 
+  const totalDecisions = stats?.total_decisions ?? history.length;
+  const approvals = Object.values(stats?.verdicts_by_mode || {})
+    .reduce((sum, counts) => sum + (counts.Approve || 0), 0);
+  const approvalRate = totalDecisions ? Math.round((approvals / totalDecisions) * 100) : 0;
+  const todayCount = stats?.daily_counts?.[stats.today] || 0;
+
   const renderHistory = () => (
     <div className="space-y-8 text-left">
       <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
         {[
-          { label: 'Total Decisions', value: history.length, sub: '+12% from last quarter', color: 'emerald' },
-          { label: 'Approval Rate', value: '72%', sub: 'Standard baseline', color: 'slate' },
-          { label: 'Avg Confidence', value: '89%', sub: '', color: 'indigo' }
+          { label: 'Total Decisions', value: totalDecisions, sub: todayCount ? `+${todayCount} today` : '', color: 'emerald' },
+          { label: 'Approval Rate', value: `${approvalRate}%`, sub: `${approvals} approved`, color: 'slate' },
+          { label: 'Avg Confidence', value: `${Math.round(stats?.average_confidence || 0)}%`, sub: '', color: 'indigo' }
         ].map((stat, i) => (
           <div key={i} className="bg-white p-6 rounded-3xl border border-slate-200 shadow-sm">
             <p className="text-xs font-bold text-slate-500 uppercase tracking-widest mb-2">{stat.label}</p>